@@ -51,7 +51,7 @@ CREATE EXTERNAL TABLE IF NOT EXISTS bmw_aftersales.tickets (
     customer_id     STRING,
     vin_last6       STRING,
     model_series    STRING,
-    model_year      INT,
+    model_year      SMALLINT,
     sla_breached    BOOLEAN
 )
 PARTITIONED BY (market STRING)
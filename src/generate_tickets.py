@@ -1,24 +1,38 @@
 """
 Synthetic BMW Aftersales Support Ticket Generator
 
-Produces realistic-looking JSON-Lines files for the demo pipeline.
+Produces realistic-looking JSON-Lines files for the demo pipeline, or
+Hive-partitioned Parquet directly (skipping the transform step).
 All data is fake — no real customer or vehicle information.
 
 Usage:
     python src/generate_tickets.py --count 5000 --output data/raw/
     python src/generate_tickets.py --count 500  --output data/raw/ --days-back 30
+    python src/generate_tickets.py --count 5000 --format parquet --output data/curated/
 """
 
 import argparse
-import json
 import os
-import random
-import uuid
-from datetime import datetime, timedelta, timezone
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from enum import Enum
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+import pyarrow as pa
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback — slower, same output
+    orjson = None
+    import json as _json
 
 # ── Import schema enums ────────────────────────────────────────
 from schema import (
+    ARROW_SCHEMA,
     MARKETS,
     MODEL_SERIES,
     MODEL_YEARS,
@@ -28,6 +42,8 @@ from schema import (
     Severity,
     Status,
 )
+from parquet_writer import clear_partitions, write_partitioned
+from progress import log
 
 # ── Probability weights (make data look realistic) ─────────────
 
@@ -79,113 +95,434 @@ DEALERS_PER_MARKET = 8
 
 # ── Helpers ─────────────────────────────────────────────────────
 
-def _weighted_choice(options_weights: dict):
-    """Pick a random key from {option: weight} dict."""
-    items = list(options_weights.keys())
-    weights = list(options_weights.values())
-    return random.choices(items, weights=weights, k=1)[0]
+def _isoformat(ts: datetime) -> str:
+    if ts.tzinfo is None:  # NumPy datetime64 → naive datetime, always UTC
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.isoformat(timespec="seconds")
+
+
+def _dumps_line(ticket: dict) -> bytes:
+    """Serialise one ticket as a UTF-8 JSON line (trailing newline included).
+
+    Timestamps are passed as `datetime` objects (naive ones are UTC); orjson
+    emits them natively in RFC 3339, truncated to seconds like the stdlib
+    fallback.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            ticket,
+            option=orjson.OPT_APPEND_NEWLINE
+            | orjson.OPT_OMIT_MICROSECONDS
+            | orjson.OPT_NAIVE_UTC,
+        )
+    line = _json.dumps(
+        ticket, ensure_ascii=False, separators=(",", ":"), default=_isoformat
+    )
+    return (line + "\n").encode("utf-8")
+
+
+# ── Vectorized generator ───────────────────────────────────────
+
+VIN_CHARS = "0123456789ABCDEFGHJKLMNPRSTUVWXYZ"  # VIN-valid chars
+
+
+def _label(option) -> str:
+    return option.value if isinstance(option, Enum) else option
+
+
+def _freeze(options_weights: dict) -> tuple[np.ndarray, np.ndarray]:
+    """{option: weight} → (label array, normalised cumulative weights)."""
+    labels = np.array([_label(o) for o in options_weights])
+    cum = np.cumsum(np.fromiter(options_weights.values(), dtype=np.float64))
+    return labels, cum / cum[-1]
+
+
+# Built once at import; keyed by the weights dict's identity
+_PRECOMP = {
+    id(d): _freeze(d)
+    for d in (SEVERITY_WEIGHTS, STATUS_WEIGHTS, CATEGORY_WEIGHTS,
+              CHANNEL_WEIGHTS, MARKET_WEIGHTS)
+}
+
+_DEALER_LABELS = np.array([
+    f"DLR-{market}-{k:03d}"
+    for market in MARKET_WEIGHTS
+    for k in range(1, DEALERS_PER_MARKET + 1)
+])
+_VIN_BYTES = np.frombuffer(VIN_CHARS.encode("ascii"), dtype=np.uint8)
+_MODEL_SERIES = np.array(MODEL_SERIES)
+_MODEL_YEARS = np.array(MODEL_YEARS, dtype=np.int16)
+
+# Indexed by the severity / status codes that _choice_vec returns
+_SLA_HOURS = np.array([SLA_TARGETS_HOURS[s] for s in SEVERITY_WEIGHTS], dtype=np.float64)
+_IS_RESOLVED = np.array([s in (Status.RESOLVED, Status.CLOSED) for s in STATUS_WEIGHTS])
+
+# Low-cardinality columns are carried as int16 codes into these label arrays
+# (the dictionary-encoded columns of ARROW_SCHEMA)
+LABELS = {
+    "severity": _PRECOMP[id(SEVERITY_WEIGHTS)][0],
+    "status": _PRECOMP[id(STATUS_WEIGHTS)][0],
+    "category": _PRECOMP[id(CATEGORY_WEIGHTS)][0],
+    "channel": _PRECOMP[id(CHANNEL_WEIGHTS)][0],
+    "market": _PRECOMP[id(MARKET_WEIGHTS)][0],
+    "dealer_id": _DEALER_LABELS,
+    "model_series": _MODEL_SERIES,
+}
+_ARROW_LABELS = {name: pa.array(labels) for name, labels in LABELS.items()}
+
 
+def _choice_vec(rng: np.random.Generator, options_weights: dict, n: int) -> np.ndarray:
+    """Draw n options from {option: weight}; return their int16 codes."""
+    _, cum = _PRECOMP[id(options_weights)]
+    return np.searchsorted(cum, rng.random(n), side="right").astype(np.int16)
 
-def _random_ts(start: datetime, end: datetime) -> datetime:
-    """Random timestamp between start and end (UTC)."""
-    delta = (end - start).total_seconds()
-    offset = random.random() * delta
-    return start + timedelta(seconds=offset)
 
+_HEX_LOWER = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+_HEX_UPPER = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
 
-def _dealer_id(market: str) -> str:
-    """Generate a deterministic-looking dealer ID."""
-    num = random.randint(1, DEALERS_PER_MARKET)
-    return f"DLR-{market}-{num:03d}"
+# Offsets of the 32 hex digits inside "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx"
+_UUID_HEX_COLS = np.array(
+    [i for i in range(36) if i not in (8, 13, 18, 23)], dtype=np.intp
+)
 
 
-def _customer_id() -> str:
-    return f"CUST-{uuid.uuid4().hex[:10].upper()}"
+def _hex_digits(raw: np.ndarray, alphabet: np.ndarray) -> np.ndarray:
+    """(n, k) bytes → (n, 2k) ASCII hex digits."""
+    out = np.empty((raw.shape[0], raw.shape[1] * 2), dtype=np.uint8)
+    out[:, 0::2] = alphabet[raw >> 4]
+    out[:, 1::2] = alphabet[raw & 0x0F]
+    return out
 
 
-def _vin_last6() -> str:
-    chars = "0123456789ABCDEFGHJKLMNPRSTUVWXYZ"  # VIN-valid chars
-    return "".join(random.choices(chars, k=6))
+def _ids_vec(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Random ticket UUIDs (v4) and customer IDs for n tickets.
 
+    All entropy comes from one os.urandom() call (16 + 5 bytes per ticket)
+    instead of two uuid4() calls per ticket, and both IDs are assembled as
+    ASCII byte matrices — no per-ticket Python string formatting.
+    """
+    raw = np.frombuffer(os.urandom(21 * n), dtype=np.uint8).reshape(n, 21)
+    uid = raw[:, :16].copy()
+    uid[:, 6] = (uid[:, 6] & 0x0F) | 0x40  # version 4
+    uid[:, 8] = (uid[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
 
-# ── Ticket generator ───────────────────────────────────────────
+    ticket = np.full((n, 36), ord("-"), dtype=np.uint8)
+    ticket[:, _UUID_HEX_COLS] = _hex_digits(uid, _HEX_LOWER)
 
-def generate_ticket(now: datetime, days_back: int) -> dict:
-    """Return a single synthetic ticket as a dict."""
+    customer = np.empty((n, 15), dtype=np.uint8)
+    customer[:, :5] = np.frombuffer(b"CUST-", dtype=np.uint8)
+    customer[:, 5:] = _hex_digits(raw[:, 16:], _HEX_UPPER)
 
-    created = _random_ts(
-        now - timedelta(days=days_back),
-        now - timedelta(hours=1),
+    return (
+        ticket.view("S36").ravel().astype("U36"),
+        customer.view("S15").ravel().astype("U15"),
     )
 
-    severity = _weighted_choice(SEVERITY_WEIGHTS)
-    status = _weighted_choice(STATUS_WEIGHTS)
 
-    # Determine resolution timestamp
-    resolved_at = None
-    resolution_hours = None
-    if status in (Status.RESOLVED, Status.CLOSED):
-        # Resolution time depends on severity (with noise)
-        base_hours = SLA_TARGETS_HOURS[severity]
-        actual_hours = max(0.5, random.gauss(base_hours * 0.8, base_hours * 0.6))
-        resolved_at = created + timedelta(hours=actual_hours)
-        if resolved_at > now:
-            resolved_at = now - timedelta(minutes=random.randint(5, 120))
-        resolution_hours = round((resolved_at - created).total_seconds() / 3600, 2)
+def generate_tickets_vec(
+    n: int, now: datetime, days_back: int, rng: np.random.Generator
+) -> dict[str, np.ndarray]:
+    """
+    Generate n synthetic tickets as a dict of column arrays.
+
+    Every column is drawn in one NumPy call. Dtypes line up with
+    ARROW_SCHEMA so Arrow can wrap most buffers without copying: timestamps
+    are `datetime64[us]` (UTC, NaT = null), `LABELS` columns and model_year
+    are int16. Use `to_records` when row dicts are needed.
+    """
+    now_s = now.timestamp()
+    start_s = now_s - days_back * 86400
+    end_s = now_s - 3600
+    created_s = start_s + rng.random(n) * (end_s - start_s)
+
+    severity = _choice_vec(rng, SEVERITY_WEIGHTS, n)
+    status = _choice_vec(rng, STATUS_WEIGHTS, n)
+    sla_hours = _SLA_HOURS[severity]
+
+    # Resolution time depends on severity (with noise)
+    is_resolved = _IS_RESOLVED[status]
+    actual_hours = np.maximum(0.5, rng.normal(sla_hours * 0.8, sla_hours * 0.6))
+    resolved_s = created_s + actual_hours * 3600
+    late_minutes = rng.integers(5, 121, size=n)
+    resolved_s = np.where(resolved_s > now_s, now_s - late_minutes * 60, resolved_s)
+    resolution_hours = np.round((resolved_s - created_s) / 3600, 2)
+
+    # SLA breach check — resolution time if resolved, else time open so far
+    hours_open = (now_s - created_s) / 3600
+    sla_breached = np.where(is_resolved, resolution_hours, hours_open) > sla_hours
+
+    updated_s = np.where(
+        is_resolved, resolved_s, created_s + rng.random(n) * (now_s - created_s)
+    )
+
+    market = _choice_vec(rng, MARKET_WEIGHTS, n)
+    dealer_id = market * DEALERS_PER_MARKET + rng.integers(
+        0, DEALERS_PER_MARKET, size=n, dtype=np.int16
+    )
 
-    # SLA breach check
-    sla_breached = False
-    if resolution_hours is not None:
-        sla_breached = resolution_hours > SLA_TARGETS_HOURS[severity]
-    elif status in (Status.OPEN, Status.IN_PROGRESS, Status.WAITING_CUSTOMER):
-        # Still open — breached if already past SLA window
-        hours_open = (now - created).total_seconds() / 3600
-        sla_breached = hours_open > SLA_TARGETS_HOURS[severity]
+    vin_last6 = (
+        _VIN_BYTES[rng.integers(0, len(_VIN_BYTES), size=(n, 6))]
+        .view("S6").ravel().astype("U6")
+    )
 
-    updated = resolved_at or _random_ts(created, now)
+    def to_ts(seconds: np.ndarray) -> np.ndarray:
+        # Whole seconds, stored at the microsecond unit of ARROW_SCHEMA
+        return (seconds.astype(np.int64) * 1_000_000).astype("datetime64[us]")
 
-    market = _weighted_choice(MARKET_WEIGHTS)
+    resolved_at = to_ts(resolved_s)
+    resolved_at[~is_resolved] = np.datetime64("NaT")
+    ticket_id, customer_id = _ids_vec(n)
 
     return {
-        "ticket_id": str(uuid.uuid4()),
-        "created_at": created.isoformat(timespec="seconds"),
-        "updated_at": updated.isoformat(timespec="seconds"),
-        "resolved_at": resolved_at.isoformat(timespec="seconds") if resolved_at else None,
-        "severity": severity.value,
-        "status": status.value,
-        "category": _weighted_choice(CATEGORY_WEIGHTS).value,
-        "channel": _weighted_choice(CHANNEL_WEIGHTS).value,
+        "ticket_id": ticket_id,
+        "created_at": to_ts(created_s),
+        "updated_at": to_ts(updated_s),
+        "resolved_at": resolved_at,
+        "severity": severity,
+        "status": status,
+        "category": _choice_vec(rng, CATEGORY_WEIGHTS, n),
+        "channel": _choice_vec(rng, CHANNEL_WEIGHTS, n),
         "market": market,
-        "dealer_id": _dealer_id(market),
-        "customer_id": _customer_id(),
-        "vin_last6": _vin_last6(),
-        "model_series": random.choice(MODEL_SERIES),
-        "model_year": random.choice(MODEL_YEARS),
+        "dealer_id": dealer_id,
+        "customer_id": customer_id,
+        "vin_last6": vin_last6,
+        "model_series": rng.integers(0, len(_MODEL_SERIES), size=n, dtype=np.int16),
+        "model_year": rng.choice(_MODEL_YEARS, size=n),
         "sla_breached": sla_breached,
     }
 
 
+def _iso_strings(ts: np.ndarray) -> np.ndarray:
+    """datetime64 array → ISO-8601 strings with UTC offset (NaT → None)."""
+    iso = np.datetime_as_string(ts, unit="s").astype(object) + "+00:00"
+    iso[np.isnat(ts)] = None
+    return iso
+
+
+def to_records(
+    columns: dict[str, np.ndarray], iso_timestamps: bool = False
+) -> list[dict]:
+    """
+    Turn a dict of column arrays into a list of ticket dicts.
+
+    Label codes are decoded back to strings. Timestamps become naive UTC
+    `datetime`s, which orjson formats natively. With iso_timestamps=True
+    they are pre-formatted as ISO strings in one NumPy pass instead — much
+    cheaper than the stdlib json `default` hook.
+    """
+    columns = {
+        name: LABELS[name][col] if name in LABELS else col
+        for name, col in columns.items()
+    }
+    if iso_timestamps:
+        columns = {
+            name: _iso_strings(col) if col.dtype.kind == "M" else col
+            for name, col in columns.items()
+        }
+    names = list(columns)
+    rows = zip(*(col.tolist() for col in columns.values()))
+    return [dict(zip(names, row)) for row in rows]
+
+
+def to_arrow(columns: dict[str, np.ndarray]) -> pa.Table:
+    """
+    Wrap ticket column arrays as an Arrow table with ARROW_SCHEMA.
+
+    Label codes become DictionaryArrays over the shared label arrays, and
+    numeric/timestamp buffers are wrapped as-is — no pandas, no re-boxing
+    and no string hashing. Only the high-cardinality string columns are
+    converted.
+    """
+    arrays = []
+    for field in ARROW_SCHEMA:
+        col = columns[field.name]
+        if field.name in LABELS:
+            arrays.append(pa.DictionaryArray.from_arrays(col, _ARROW_LABELS[field.name]))
+        else:
+            arrays.append(pa.array(col, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=ARROW_SCHEMA)
+
+
 # ── File writer ─────────────────────────────────────────────────
 
-def write_jsonlines(tickets: list[dict], output_dir: Path, batch_size: int = 1000):
+# Rows drawn per generate_tickets_vec call. Fixed, so a seed yields the same
+# ticket attributes whatever --batch-size or --format is chosen (IDs come
+# from os.urandom and are always fresh).
+GEN_CHUNK_ROWS = 1 << 16
+
+
+def iter_tickets_vec(
+    count: int, now: datetime, days_back: int, rng: np.random.Generator
+) -> Iterator[dict[str, np.ndarray]]:
+    """Yield `count` tickets as column chunks of at most GEN_CHUNK_ROWS rows."""
+    for start in range(0, count, GEN_CHUNK_ROWS):
+        yield generate_tickets_vec(
+            min(GEN_CHUNK_ROWS, count - start), now, days_back, rng
+        )
+
+
+def _slices(columns: dict[str, np.ndarray], size: int) -> Iterator[dict[str, np.ndarray]]:
+    """Split a column chunk into row slices of at most `size` (views, no copies)."""
+    n = len(columns["ticket_id"])
+    for start in range(0, n, size):
+        yield {name: col[start : start + size] for name, col in columns.items()}
+
+
+# Max buffers per writev() call (IOV_MAX, 1024 on Linux). sysconf may be
+# missing, not know the name, or report -1 for "indeterminate".
+try:
+    _n = os.sysconf("SC_IOV_MAX")
+except (ValueError, OSError, AttributeError):
+    _n = -1
+_IOV_MAX = _n if _n > 0 else 1024
+del _n
+_HAS_WRITEV = hasattr(os, "writev")
+
+# Without writev, lines go through a 1 MiB buffer instead of the 8 KiB default
+_WRITE_BUFFER = 1 << 20
+
+
+def _write_lines(f, lines: list[bytes]):
+    """
+    Append encoded lines to a file opened by write_jsonlines.
+
+    Uses os.writev() where available so a batch lands in one syscall per
+    IOV_MAX lines without first concatenating it (the file is unbuffered).
+    Elsewhere (e.g. Windows) the file has a 1 MiB buffer that coalesces
+    the lines into large writes.
+    """
+    if not _HAS_WRITEV:
+        f.writelines(lines)
+        return
+
+    fd = f.fileno()
+    for i in range(0, len(lines), _IOV_MAX):
+        chunk = lines[i : i + _IOV_MAX]
+        written = os.writev(fd, chunk)
+        if written < sum(map(len, chunk)):  # short write — finish the rest
+            rest = memoryview(b"".join(chunk))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
+
+
+def write_jsonlines(
+    tickets: Iterable[dict], output_dir: Path, batch_size: int = 1000, label: str | None = None
+):
     """
-    Write tickets as JSON-Lines files, split into batches.
-    Each file: tickets_YYYYMMDD_HHMMSS_<batch>.jsonl
+    Write tickets to a single JSON-Lines file: tickets_<label>.jsonl
+    (label defaults to YYYYMMDD_HHMMSS).
+
+    `tickets` is consumed lazily and encoded/written one batch at a time,
+    so a generator keeps peak memory at O(batch_size). Summary stats are
+    accumulated in the same pass; returns (row_count, stats) where
+    stats = {"breached": int, "sev": Counter}.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    ts_label = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    label = label or datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    fname = output_dir / f"tickets_{label}.jsonl"
+
+    n_tickets = 0
+    stats = {"breached": 0, "sev": Counter()}
+    tickets = iter(tickets)
+    with open(fname, "wb", buffering=0 if _HAS_WRITEV else _WRITE_BUFFER) as f:
+        while batch := list(islice(tickets, batch_size)):
+            _write_lines(f, [_dumps_line(t) for t in batch])
+            n_tickets += len(batch)
+            stats["breached"] += sum(t["sla_breached"] for t in batch)
+            stats["sev"].update(t["severity"] for t in batch)
+    log(f"  ✓ Wrote {n_tickets:,} tickets → {fname}")
+
+    return n_tickets, stats
+
+
+def write_parquet(
+    chunks: Iterable[dict[str, np.ndarray]], output_dir: Path, part_prefix: str = "part"
+):
+    """
+    Write ticket column chunks as Hive-partitioned Parquet (one dir per
+    market). Layout matches transform_to_parquet.py:
+    <output>/tickets/market=XX/<part_prefix>-<i>.parquet
+
+    Chunks are streamed into the writer as record batches, so only one
+    chunk of NumPy columns is alive at a time. Each market buffers up to
+    GEN_CHUNK_ROWS rows before writing a row group, which keeps row
+    groups large for Athena while bounding memory regardless of shard
+    size. Returns (row_count, stats) like write_jsonlines.
+    """
+    n_tickets = 0
+    stats = {"breached": 0, "sev": Counter()}
+
+    def batches():
+        nonlocal n_tickets
+        for columns in chunks:
+            n_tickets += len(columns["ticket_id"])
+            counts = np.bincount(columns["severity"], minlength=len(LABELS["severity"]))
+            sev = zip(LABELS["severity"].tolist(), counts.tolist())
+            stats["breached"] += int(columns["sla_breached"].sum())
+            stats["sev"].update({label: n for label, n in sev if n})
+            yield from to_arrow(columns).to_batches()
+
+    write_partitioned(
+        batches(), output_dir / "tickets", part_prefix,
+        min_rows_per_group=GEN_CHUNK_ROWS,
+    )
+    return n_tickets, stats
+
 
-    file_count = 0
-    for i in range(0, len(tickets), batch_size):
-        batch = tickets[i : i + batch_size]
-        fname = output_dir / f"tickets_{ts_label}_{file_count:04d}.jsonl"
-        with open(fname, "w", encoding="utf-8") as f:
-            for t in batch:
-                f.write(json.dumps(t, ensure_ascii=False) + "\n")
-        file_count += 1
-        print(f"  ✓ Wrote {len(batch):,} tickets → {fname}")
+# ── Parallel generation ─────────────────────────────────────────
 
-    return file_count
+# Smallest shard worth a process — keeps Parquet parts from fragmenting
+# into shards × markets tiny files on small runs
+MIN_SHARD_ROWS = 100_000
+
+# Upper bound on shards per run, so file counts stay bounded as --count
+# grows; large shards are generated in GEN_CHUNK_ROWS chunks instead
+MAX_SHARDS = 8
+
+# Default pool size: one process per CPU, capped at MAX_SHARDS since extra
+# workers would sit idle. Only throughput depends on it — the tickets do not.
+DEFAULT_WORKERS = min(MAX_SHARDS, os.cpu_count() or 1)
+
+
+def _generate_shard(
+    rank: int,
+    count: int,
+    seed_seq: np.random.SeedSequence,
+    now: datetime,
+    days_back: int,
+    output_dir: Path,
+    fmt: str,
+    batch_size: int,
+    ts_label: str,
+):
+    """
+    Generate and write one shard of tickets in a worker process.
+
+    Each shard writes its own output — one JSON-Lines file, or one Parquet
+    file per market — named by rank, so only the writer's small
+    (row_count, stats) result crosses the process boundary.
+
+    `seed_seq` is this shard's child of the run's SeedSequence, giving each
+    shard an independent PCG64 stream.
+    """
+    rng = np.random.Generator(np.random.PCG64(seed_seq))
+    chunks = iter_tickets_vec(count, now, days_back, rng)
+
+    if fmt == "parquet":
+        return write_parquet(chunks, output_dir, part_prefix=f"part-{rank}")
+
+    # Stream batch-sized slices into the writer — no ticket list is ever
+    # materialised
+    tickets = (
+        ticket
+        for columns in chunks
+        for batch in _slices(columns, batch_size)
+        for ticket in to_records(batch, iso_timestamps=orjson is None)
+    )
+    return write_jsonlines(
+        tickets, output_dir, batch_size, label=f"{ts_label}_{rank:04d}"
+    )
 
 
 # ── CLI ─────────────────────────────────────────────────────────
@@ -199,8 +536,12 @@ def main():
         help="Number of tickets to generate (default: 5000)",
     )
     parser.add_argument(
-        "--output", type=str, default="data/raw",
-        help="Output directory for JSON-Lines files (default: data/raw)",
+        "--format", choices=("jsonl", "parquet"), default="jsonl",
+        help="jsonl = raw landing files, parquet = curated tables (default: jsonl)",
+    )
+    parser.add_argument(
+        "--output", type=str, default=None,
+        help="Output directory (default: data/raw for jsonl, data/curated for parquet)",
     )
     parser.add_argument(
         "--days-back", type=int, default=90,
@@ -208,30 +549,73 @@ def main():
     )
     parser.add_argument(
         "--batch-size", type=int, default=1000,
-        help="Tickets per output file (default: 1000)",
+        help="Tickets encoded per write, JSON-Lines only (default: 1000)",
     )
     parser.add_argument(
         "--seed", type=int, default=42,
-        help="Random seed for reproducibility (default: 42)",
+        help="Non-negative random seed for reproducibility (default: 42)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS,
+        help=f"Max worker processes; output is split into at most {MAX_SHARDS} "
+             f"shards of at least {MIN_SHARD_ROWS:,} tickets (default: {DEFAULT_WORKERS})",
     )
     args = parser.parse_args()
+    if args.seed < 0:  # SeedSequence only takes non-negative entropy
+        parser.error(f"--seed must be a non-negative integer, got {args.seed}")
+    if args.batch_size < 1:
+        parser.error(f"--batch-size must be at least 1, got {args.batch_size}")
 
-    random.seed(args.seed)
     now = datetime.now(timezone.utc)
-
-    print(f"Generating {args.count:,} synthetic tickets (past {args.days_back} days)…")
-    tickets = [generate_ticket(now, args.days_back) for _ in range(args.count)]
-
-    output_path = Path(args.output)
-    n_files = write_jsonlines(tickets, output_path, args.batch_size)
-
-    print(f"\nDone! {args.count:,} tickets written across {n_files} file(s) in {output_path}/")
-
-    # Quick stats
-    breached = sum(1 for t in tickets if t["sla_breached"])
-    print(f"  SLA breach rate: {breached / len(tickets) * 100:.1f}%")
-    from collections import Counter
-    sev = Counter(t["severity"] for t in tickets)
+    ts_label = now.strftime("%Y%m%d_%H%M%S")
+    if args.format == "parquet":
+        output_path = Path(args.output or "data/curated")
+    else:
+        output_path = Path(args.output or "data/raw")
+
+    # Split the work evenly into 1..MAX_SHARDS shards of at least
+    # MIN_SHARD_ROWS; the first `extra` shards get one more ticket. The plan
+    # depends only on --count, so a given --seed yields the same ticket
+    # attributes for any --workers.
+    n_shards = min(MAX_SHARDS, max(1, args.count // MIN_SHARD_ROWS))
+    base, extra = divmod(args.count, n_shards)
+    shard_counts = [base + (rank < extra) for rank in range(n_shards)]
+    n_workers = max(1, min(args.workers, n_shards))
+
+    if args.format == "parquet":
+        # Workers share the market=XX/ dirs, so stale parts are cleared up front
+        clear_partitions(output_path / "tickets")
+
+    print(
+        f"Generating {args.count:,} synthetic tickets (past {args.days_back} days) "
+        f"in {n_shards} shard(s) on {n_workers} worker(s)…"
+    )
+    shard_args = (
+        range(n_shards),
+        shard_counts,
+        np.random.SeedSequence(args.seed).spawn(n_shards),
+        [now] * n_shards,
+        [args.days_back] * n_shards,
+        [output_path] * n_shards,
+        [args.format] * n_shards,
+        [args.batch_size] * n_shards,
+        [ts_label] * n_shards,
+    )
+    if n_shards == 1:
+        # A lone shard runs in-process — a pool would only add a worker
+        # start-up (re-importing NumPy and Arrow) and a pickled result
+        results = list(map(_generate_shard, *shard_args))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as ex:
+            results = list(ex.map(_generate_shard, *shard_args))
+
+    n_tickets = sum(n for n, _ in results)
+    print(f"\nDone! {n_tickets:,} tickets written to {output_path}/")
+
+    # Quick stats (tallied by the writers as they went)
+    breached = sum(stats["breached"] for _, stats in results)
+    print(f"  SLA breach rate: {breached / max(n_tickets, 1) * 100:.1f}%")
+    sev = sum((stats["sev"] for _, stats in results), Counter())
     print(f"  Severity mix: { {k: v for k, v in sorted(sev.items())} }")
 
 
@@ -0,0 +1,74 @@
+"""
+Partitioned Parquet writer shared by the generator and the transform.
+
+Writes ticket tables as Hive-style <base_dir>/market=XX/ directories,
+the layout the Athena table in infra/athena_ddl.sql expects.
+"""
+
+from pathlib import Path
+from typing import Iterable
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from progress import log
+from schema import ARROW_SCHEMA
+
+
+# Snappy keeps Athena scans cheap while staying fast to decode
+PARQUET_OPTIONS = ds.ParquetFileFormat().make_write_options(compression="snappy")
+MAX_ROWS_PER_FILE = 1_000_000
+
+
+def write_partitioned(
+    data: pa.Table | Iterable[pa.RecordBatch],
+    base_dir: Path,
+    part_prefix: str = "part",
+    min_rows_per_group: int = 0,
+) -> int:
+    """
+    Write a ticket table, or a stream of record batches with ARROW_SCHEMA,
+    as Hive-partitioned Parquet in one pass:
+    <base_dir>/market=XX/<part_prefix>-<i>.parquet
+
+    Rows are buffered per partition until `min_rows_per_group` have
+    arrived, so small incoming batches don't each become a row group.
+    The default of 0 writes batches as they come; callers streaming
+    unbounded input should pass a bounded floor to cap memory. The
+    partition column is dropped from the data files themselves. Returns
+    the number of files written.
+    """
+    written = []
+
+    def log_file(f):
+        written.append(f.path)
+        log(f"  ✓ {f.metadata.num_rows:,} tickets → {f.path}")
+
+    ds.write_dataset(
+        data,
+        base_dir,
+        schema=ARROW_SCHEMA,
+        format="parquet",
+        file_options=PARQUET_OPTIONS,
+        partitioning=ds.partitioning(
+            pa.schema([ARROW_SCHEMA.field("market")]), flavor="hive"
+        ),
+        basename_template=f"{part_prefix}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_file=MAX_ROWS_PER_FILE,
+        min_rows_per_group=min_rows_per_group,
+        max_rows_per_group=MAX_ROWS_PER_FILE,
+        file_visitor=log_file,
+    )
+    return len(written)
+
+
+def clear_partitions(base_dir: Path) -> None:
+    """
+    Delete the Parquet parts left in <base_dir>/market=XX/ by earlier runs.
+
+    write_partitioned only overwrites files whose names it reuses, so a
+    run producing fewer parts would otherwise leave stale rows behind.
+    """
+    for stale in base_dir.glob("market=*/part-*.parquet"):
+        stale.unlink()
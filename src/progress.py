@@ -0,0 +1,11 @@
+"""
+Progress output shared by the generator and the Parquet writer.
+"""
+
+
+def log(msg: str) -> None:
+    """
+    Print one progress line as a single write, so lines from parallel
+    generator workers sharing stdout never interleave.
+    """
+    print(msg + "\n", end="", flush=True)
@@ -9,6 +9,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+import pyarrow as pa
+
 
 # ── Enumerations ────────────────────────────────────────────────
 
@@ -116,3 +118,29 @@ SLA_TARGETS_HOURS = {
     Severity.P3: 48,
     Severity.P4: 120,
 }
+
+
+# ── Arrow / Parquet schema ──────────────────────────────────────
+
+# Low-cardinality labels are dictionary-encoded in memory and on disk;
+# high-cardinality IDs (ticket_id, customer_id, vin_last6) stay plain.
+_LABEL = pa.dictionary(pa.int16(), pa.string())
+_TS = pa.timestamp("us", tz="UTC")
+
+ARROW_SCHEMA = pa.schema([
+    ("ticket_id", pa.string()),
+    ("created_at", _TS),
+    ("updated_at", _TS),
+    ("resolved_at", _TS),
+    ("severity", _LABEL),
+    ("status", _LABEL),
+    ("category", _LABEL),
+    ("channel", _LABEL),
+    ("market", _LABEL),          # partition key — not stored in data files
+    ("dealer_id", _LABEL),       # ~80 distinct values
+    ("customer_id", pa.string()),
+    ("vin_last6", pa.string()),
+    ("model_series", _LABEL),
+    ("model_year", pa.int16()),
+    ("sla_breached", pa.bool_()),
+])
@@ -10,9 +10,23 @@ Usage:
 """
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.json as paj
+
+from parquet_writer import MAX_ROWS_PER_FILE, clear_partitions, write_partitioned
+from schema import ARROW_SCHEMA
+
+# The JSON reader can't decode straight into dictionary types:
+# parse labels as plain strings, dictionary-encode on the final cast.
+JSON_SCHEMA = pa.schema([
+    pa.field(f.name, f.type.value_type if pa.types.is_dictionary(f.type) else f.type)
+    for f in ARROW_SCHEMA
+])
 
 
 def transform(input_dir: str = "data/raw", output_dir: str = "data/curated"):
@@ -26,29 +40,26 @@ def transform(input_dir: str = "data/raw", output_dir: str = "data/curated"):
         print(f"No .jsonl files found in {input_path}")
         return
 
-    dfs = [pd.read_json(f, lines=True) for f in jsonl_files]
-    df = pd.concat(dfs, ignore_index=True)
-    print(f"Loaded {len(df):,} tickets from {len(jsonl_files)} file(s)")
+    # Arrow's C++ reader releases the GIL → files are parsed concurrently.
+    # Timestamps are parsed on read.
+    read = partial(
+        paj.read_json, parse_options=paj.ParseOptions(explicit_schema=JSON_SCHEMA)
+    )
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        tables = list(ex.map(read, jsonl_files))
+    table = pa.concat_tables(tables, promote_options="default")
+    print(f"Loaded {table.num_rows:,} tickets from {len(jsonl_files)} file(s)")
 
     # ── 2. Type casting ─────────────────────────────────────
-    for col in ("created_at", "updated_at", "resolved_at"):
-        df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
-
-    df["model_year"] = df["model_year"].astype("int32")
-    df["sla_breached"] = df["sla_breached"].astype("bool")
+    table = table.select(ARROW_SCHEMA.names).cast(ARROW_SCHEMA)
 
     # ── 3. Write partitioned Parquet (Hive-style) ───────────
     # Creates:  data/curated/tickets/market=DE/part-0.parquet
     #           data/curated/tickets/market=US/part-0.parquet  …
-    for market, group in df.groupby("market"):
-        market_dir = output_path / f"market={market}"
-        market_dir.mkdir(parents=True, exist_ok=True)
-
-        # Drop the partition column from the data file itself
-        part = group.drop(columns=["market"])
-        out_file = market_dir / "part-0.parquet"
-        part.to_parquet(out_file, engine="pyarrow", compression="snappy", index=False)
-        print(f"  ✓ {market}: {len(part):,} tickets → {out_file}")
+    # The table is already in memory, so buffer each market into a single
+    # row group instead of one per ~1 MB read_json chunk.
+    clear_partitions(output_path)
+    write_partitioned(table, output_path, min_rows_per_group=MAX_ROWS_PER_FILE)
 
     print(f"\nDone! Parquet files in {output_path}/")
     print(f"Upload with:  aws s3 sync {output_path}/ s3://bmw-aftersales-curated-<ACCOUNT_ID>/tickets/")